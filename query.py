@@ -1,5 +1,6 @@
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
@@ -18,7 +19,7 @@ from tools.fortran_utils import iter_fortran_sources
 from tools.git_tools import build_git_tools
 from tools.namelist_tools import build_namelist_tool
 from tools.project_state import build_project_overview_tools
-from tools.tool_spec import ToolSpec
+from tools.tool_spec import ToolSpec, tools_payload
 
 console = Console()
 
@@ -159,13 +160,22 @@ def describe_fortran_files(project_root: Path) -> str:
 
 
 def _invoke_tool(tool: ToolSpec, args: Dict, call_name: str) -> str:
-    console.print(_format_tool_call(call_name, args), style="bold red")
     try:
         return tool.func(args)
     except Exception as exc:
         return f"Tool '{call_name}' raised an error: {exc}"
 
 
+def _tool_message(call: Dict, name: str, content: str) -> Dict[str, str]:
+    console.print(f'{content}\n', style="yellow")
+    return {
+        "role": "tool",
+        "name": name,
+        "content": content,
+        "tool_call_id": call.get("id"),
+    }
+
+
 def _handle_tool_call(
     call: Dict, name_to_tool: Dict[str, ToolSpec]
 ) -> Dict[str, str]:
@@ -176,14 +186,29 @@ def _handle_tool_call(
     if not tool:
         content = f"Tool '{name}' is not available."
     else:
+        console.print(_format_tool_call(name, args), style="bold red")
         content = _invoke_tool(tool, args, name)
-    console.print(f'{content}\n', style="yellow")
-    return {
-        "role": "tool",
-        "name": name,
-        "content": content,
-        "tool_call_id": call.get("id"),
-    }
+    return _tool_message(call, name, content)
+
+
+def _handle_tool_calls(
+    tool_calls: List[Dict], name_to_tool: Dict[str, ToolSpec]
+) -> List[Dict[str, str]]:
+    """Run one turn's tool calls, overlapping them when every call is read-only."""
+    payloads = [call.get("function", {}) or {} for call in tool_calls]
+    tools = [name_to_tool.get(payload.get("name") or "unknown") for payload in payloads]
+    if len(tool_calls) < 2 or not all(tool and tool.read_only for tool in tools):
+        return [_handle_tool_call(call, name_to_tool) for call in tool_calls]
+
+    arg_sets = [_parse_arguments(payload.get("arguments")) for payload in payloads]
+    for tool, args in zip(tools, arg_sets):
+        console.print(_format_tool_call(tool.name, args), style="bold red")
+    with ThreadPoolExecutor(max_workers=min(8, len(tool_calls))) as pool:
+        contents = list(pool.map(_invoke_tool, tools, arg_sets, [tool.name for tool in tools]))
+    return [
+        _tool_message(call, tool.name, content)
+        for call, tool, content in zip(tool_calls, tools, contents)
+    ]
 
 
 def call_model_with_tools(
@@ -191,7 +216,7 @@ def call_model_with_tools(
 ) -> Dict[str, str]:
     """Send the conversation to Ollama, honoring tool-calling responses."""
     name_to_tool = {tool.name: tool for tool in tools}
-    ollama_tools = [tool.as_ollama_tool() for tool in tools]
+    ollama_tools = tools_payload(tools)
 
     while True:
         response = ollama.chat(model=model, messages=messages, tools=ollama_tools, options={"num_ctx" : num_ctx})
@@ -201,10 +226,7 @@ def call_model_with_tools(
             return message
 
         messages.append(message)
-        tool_messages = [
-            _handle_tool_call(call, name_to_tool) for call in tool_calls
-        ]
-        messages.extend(tool_messages)
+        messages.extend(_handle_tool_calls(tool_calls, name_to_tool))
 
 
 def main():
@@ -10,8 +10,8 @@ def _capture_make_output(repo_root: Path) -> str:
         completed = subprocess.run(
             ["make"],
             cwd=str(repo_root),
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=False,
         )
     except FileNotFoundError:
@@ -19,7 +19,7 @@ def _capture_make_output(repo_root: Path) -> str:
     except Exception as exc:
         return f"Build failed to run: {exc}"
 
-    stderr_lines = completed.stderr.splitlines() if completed.stderr else []
+    stderr_lines = completed.stderr.decode("utf-8", errors="replace").splitlines()
 
     if completed.returncode == 0:
         return "Build succeeded."
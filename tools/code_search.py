@@ -112,7 +112,10 @@ def search_codebase(
 
     for file_path in candidates:
         try:
-            lines = file_path.read_text(encoding="utf-8", errors="ignore").splitlines(keepends=True)
+            text = file_path.read_text(encoding="utf-8", errors="ignore")
+            if lowered not in text.lower():
+                continue
+            lines = text.splitlines(keepends=True)
 
             # Find all matching line indices in this file
             match_indices: List[int] = [
@@ -180,6 +183,7 @@ def build_code_search_tool(project_root: Path) -> ToolSpec:
             "required": ["query"],
         },
         func=_tool,
+        read_only=True,
     )
 
 
@@ -207,6 +211,7 @@ def build_fortran_summary_tool(project_root: Path) -> ToolSpec:
             "required": ["file_path"],
         },
         func=_tool,
+        read_only=True,
     )
 
 
@@ -245,6 +250,7 @@ def _build_specific_symbol_tool(project_root: Path, symbol_kind: str) -> ToolSpe
             "required": ["file_path", "symbol_name"],
         },
         func=_tool,
+        read_only=True,
     )
 
 
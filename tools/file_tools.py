@@ -1,11 +1,28 @@
+import os
 import shutil
+import stat
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from .path_utils import resolve_within_root
+from .path_utils import resolve_within_root, resolved_root
 from .snippet_utils import format_numbered_snippet, iter_numbered_lines
 from .tool_spec import ToolSpec
 
+_write_generation = 0
+_write_generation_lock = threading.Lock()  # writes may run on worker threads
+_known_backups: Set[str] = set()
+
+
+def write_generation() -> int:
+    """Return a counter that changes whenever a tool writes a project file."""
+    return _write_generation
+
+
+def reset_backup_cache() -> None:
+    """Forget which '.orig' backups are known to exist so the next edit re-checks disk."""
+    _known_backups.clear()
+
 
 def read_file(
     project_root: Path,
@@ -38,55 +55,98 @@ def _resolve_project_file(project_root: Path, file_path: str) -> Tuple[Optional[
         path = resolve_within_root(project_root, file_path)
     except ValueError as exc:
         return None, str(exc)
-    relative = str(path.relative_to(project_root.resolve()))
+    relative = os.path.relpath(path, resolved_root(project_root))
     return path, relative
 
 
-def _ensure_backup(project_root: Path, target: Path, relative: str) -> Tuple[bool, str]:
-    backup_path = target.with_name(target.name + ".orig")
+def _copy_file_fast(source: str, destination: str) -> None:
+    """Copy like shutil.copy2, letting the kernel move (or reflink) the data when it can."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copy2(source, destination)
+        return
     try:
-        backup_relative = str(backup_path.relative_to(project_root.resolve()))
-    except ValueError:
-        backup_relative = str(backup_path)
-
-    if backup_path.exists():
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            size = os.fstat(src.fileno()).st_size
+            copied = 0
+            while True:
+                chunk = copy_range(src.fileno(), dst.fileno(), 1 << 30)
+                if not chunk:
+                    break
+                copied += chunk
+    except OSError:
+        # Unsupported filesystem or cross-device copy: shutil rewrites the file.
+        shutil.copy2(source, destination)
+        return
+    if copied != size:
+        # Some filesystems (e.g. procfs-like or network mounts) report 0 without copying.
+        shutil.copy2(source, destination)
+        return
+    shutil.copystat(source, destination)
+
+
+def _ensure_backup(target: Path, relative: str) -> Tuple[bool, str]:
+    source = str(target)
+    backup_path = source + ".orig"
+    backup_relative = relative + ".orig"
+
+    if backup_path in _known_backups or os.path.exists(backup_path):
+        _known_backups.add(backup_path)
         return True, f"Backup already exists at '{backup_relative}'."
 
     try:
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(target, backup_path)
+        _copy_file_fast(source, backup_path)
     except OSError as exc:
         return False, f"Failed to create backup file: {exc}"
 
+    _known_backups.add(backup_path)
     return True, f"Copied '{relative}' to '{backup_relative}'."
 
 
-def write_whole_file(project_root: Path, file_path: str, content: str) -> str:
+def write_whole_file_checked(
+    project_root: Path, file_path: str, content: str
+) -> Tuple[bool, str]:
+    """Write a whole file, returning (success, message) so callers need not parse text."""
     path, relative_or_error = _resolve_project_file(project_root, file_path)
     if path is None:
-        return relative_or_error
+        return False, relative_or_error
 
     backup_msg = ""
-    if path.exists():
-        if not path.is_file():
-            return f"Path '{relative_or_error}' is not a regular file."
-        ok, backup_msg = _ensure_backup(project_root, path, relative_or_error)
-        if not ok:
-            return backup_msg
-
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        st: Optional[os.stat_result] = os.stat(path)
+    except FileNotFoundError:
+        st = None
     except OSError as exc:
-        return f"Failed to create parent directory for '{relative_or_error}': {exc}"
-
+        return False, f"Failed to stat '{relative_or_error}': {exc}"
+    if st is not None:
+        if not stat.S_ISREG(st.st_mode):
+            return False, f"Path '{relative_or_error}' is not a regular file."
+        ok, backup_msg = _ensure_backup(path, relative_or_error)
+        if not ok:
+            return False, backup_msg
+    else:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            return False, f"Failed to create parent directory for '{relative_or_error}': {exc}"
+
+    global _write_generation
+    data = content.encode("utf-8")
     try:
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(data)
     except OSError as exc:
-        return f"Failed to write '{relative_or_error}': {exc}"
+        return False, f"Failed to write '{relative_or_error}': {exc}"
+    finally:
+        with _write_generation_lock:
+            _write_generation += 1
 
     if backup_msg:
-        return f"{backup_msg}\nWrote {len(content)} byte(s) to '{relative_or_error}'."
-    return f"Wrote {len(content)} byte(s) to new file '{relative_or_error}'."
+        return True, f"{backup_msg}\nWrote {len(data)} byte(s) to '{relative_or_error}'."
+    return True, f"Wrote {len(data)} byte(s) to new file '{relative_or_error}'."
+
+
+def write_whole_file(project_root: Path, file_path: str, content: str) -> str:
+    return write_whole_file_checked(project_root, file_path, content)[1]
 
 
 def build_file_reader_tools(project_root: Path) -> List[ToolSpec]:
@@ -94,11 +154,12 @@ def build_file_reader_tools(project_root: Path) -> List[ToolSpec]:
 
     def _snippet_tool(args: Dict[str, int]) -> str:
         path = args.get("path", ".")
-        start = int(args.get("start_line", 1) or 1)
         max_lines_value = args.get("max_lines")
-        max_lines_int = (
-            int(max_lines_value) if max_lines_value is not None else 400
-        )
+        try:
+            start = int(args.get("start_line", 1) or 1)
+            max_lines_int = int(max_lines_value) if max_lines_value is not None else 400
+        except (TypeError, ValueError):
+            return "'start_line' and 'max_lines' must be integers."
         return read_file(project_root, path, start_line=start, max_lines=max_lines_int)
 
     read_file_snippet_tool = ToolSpec(
@@ -128,6 +189,7 @@ def build_file_reader_tools(project_root: Path) -> List[ToolSpec]:
             "required": ["path"],
         },
         func=_snippet_tool,
+        read_only=True,
     )
 
     def _whole_file_tool(args: Dict) -> str:
@@ -150,6 +212,7 @@ def build_file_reader_tools(project_root: Path) -> List[ToolSpec]:
             "required": ["path"],
         },
         func=_whole_file_tool,
+        read_only=True,
     )
 
     def _write_whole_file_tool(args: Dict) -> str:
@@ -1,11 +1,16 @@
+import os
+import stat
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from .file_tools import write_whole_file
+from .file_tools import write_whole_file_checked
 from .fortran_utils import FortranEntity, find_entity_by_name, parse_fortran_entities
-from .path_utils import resolve_within_root
+from .path_utils import resolve_within_root, resolved_root
 from .tool_spec import ToolSpec
 
+_CALLABLE_KINDS = frozenset(("subroutine", "function"))
+_CONTAINER_KINDS = frozenset(("module", "program"))
+
 
 def _resolve_existing_file(project_root: Path, file_path: str) -> Tuple[Optional[Path], str]:
     if not file_path.strip():
@@ -14,10 +19,14 @@ def _resolve_existing_file(project_root: Path, file_path: str) -> Tuple[Optional
         target = resolve_within_root(project_root, file_path)
     except ValueError as exc:
         return None, str(exc)
-    relative = str(target.relative_to(project_root.resolve()))
-    if not target.exists():
+    relative = os.path.relpath(target, resolved_root(project_root))
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
         return None, f"File '{relative}' does not exist."
-    if not target.is_file():
+    except OSError as exc:
+        return None, f"Failed to stat '{relative}': {exc}"
+    if not stat.S_ISREG(st.st_mode):
         return None, f"Path '{relative}' is not a regular file."
     return target, ""
 
@@ -30,7 +39,7 @@ def _locate_parent_entity(
     parent = find_entity_by_name(root, parent_name, None)
     if not parent:
         return None, f"Parent module/program '{parent_name}' not found."
-    if parent.kind not in {"module", "program"}:
+    if parent.kind not in _CONTAINER_KINDS:
         return None, f"Parent '{parent_name}' is a {parent.kind}, expected module or program."
     return parent, f"{parent.kind} {parent.name}"
 
@@ -51,7 +60,7 @@ def _find_child(
 def _ensure_contains_section(
     lines: List[str], parent: FortranEntity, insertion_index: int
 ) -> int:
-    if parent.kind not in {"module", "program"}:
+    if parent.kind not in _CONTAINER_KINDS:
         return 0
     start = parent.start_index
     end = min(parent.end_index if parent.end_index is not None else len(lines), len(lines))
@@ -64,20 +73,20 @@ def _ensure_contains_section(
     return len(block)
 
 
-def _insert_callable_lines(
-    lines: List[str], insertion_index: int, callable_lines: List[str]
-) -> int:
+def _splice_callable_lines(
+    lines: List[str], start: int, stop: int, callable_lines: List[str]
+) -> None:
+    """Replace lines[start:stop] with the callable, padding it with blank lines."""
     if not callable_lines:
-        return insertion_index
+        return
 
     block: List[str] = callable_lines[:]
-    if insertion_index > 0 and lines[insertion_index - 1].strip() and block[0].strip():
+    if start > 0 and lines[start - 1].strip() and block[0].strip():
         block.insert(0, "")
-    if insertion_index < len(lines) and lines[insertion_index].strip() and block[-1].strip():
+    if stop < len(lines) and lines[stop].strip() and block[-1].strip():
         block.append("")
 
-    lines[insertion_index:insertion_index] = block
-    return insertion_index
+    lines[start:stop] = block
 
 
 def _create_callable_text(
@@ -89,6 +98,13 @@ def _create_callable_text(
     append_after: Optional[str],
     callable_content: str,
 ) -> Tuple[Optional[str], str]:
+    normalized_type = callable_type.lower()
+    if normalized_type not in _CALLABLE_KINDS:
+        return None, "callable_type must be 'subroutine' or 'function'."
+    callable_lines = callable_content.splitlines()
+    if not callable_lines or not callable_content.strip():
+        return None, "callable_content must include the new Fortran code."
+
     file_path_obj, error = _resolve_existing_file(project_root, file_path)
     if not file_path_obj:
         return None, error
@@ -103,9 +119,6 @@ def _create_callable_text(
     if not parent:
         return None, parent_desc
 
-    normalized_type = callable_type.lower()
-    if normalized_type not in {"subroutine", "function"}:
-        return None, "callable_type must be 'subroutine' or 'function'."
     normalized_name = name.lower()
     for child in parent.children:
         if child.name.lower() == normalized_name and child.kind == normalized_type:
@@ -133,11 +146,7 @@ def _create_callable_text(
             insertion_index = min(parent_end, len(lines))
         insertion_index += _ensure_contains_section(lines, parent, insertion_index)
 
-    callable_lines = callable_content.splitlines()
-    if not callable_lines or not callable_content.strip():
-        return None, "callable_content must include the new Fortran code."
-
-    _insert_callable_lines(lines, insertion_index, callable_lines)
+    _splice_callable_lines(lines, insertion_index, insertion_index, callable_lines)
 
     new_text = "\n".join(lines)
     if had_trailing_newline:
@@ -160,6 +169,13 @@ def _edit_callable_text(
     parent_name: Optional[str],
     callable_content: str,
 ) -> Tuple[Optional[str], str]:
+    normalized_type = callable_type.lower()
+    if normalized_type not in _CALLABLE_KINDS:
+        return None, "callable_type must be 'subroutine' or 'function'."
+    callable_lines = callable_content.splitlines()
+    if not callable_lines or not callable_content.strip():
+        return None, "callable_content must include the replacement Fortran code."
+
     file_path_obj, error = _resolve_existing_file(project_root, file_path)
     if not file_path_obj:
         return None, error
@@ -174,25 +190,17 @@ def _edit_callable_text(
     if not parent:
         return None, parent_desc
 
-    normalized_type = callable_type.lower()
-    if normalized_type not in {"subroutine", "function"}:
-        return None, "callable_type must be 'subroutine' or 'function'."
     target_callable = _find_child(parent, name, allowed_kinds=[normalized_type])
     if not target_callable:
         return None, f"{normalized_type.title()} '{name}' not found in {parent_desc}."
 
-    callable_lines = callable_content.splitlines()
-    if not callable_lines or not callable_content.strip():
-        return None, "callable_content must include the replacement Fortran code."
-
     start_index = max(target_callable.start_index, 0)
     end_index = target_callable.end_index
     if end_index is None:
         end_index = start_index
     end_index = min(len(lines) - 1, end_index) if lines else start_index
 
-    del lines[start_index : end_index + 1]
-    _insert_callable_lines(lines, start_index, callable_lines)
+    _splice_callable_lines(lines, start_index, end_index + 1, callable_lines)
 
     new_text = "\n".join(lines)
     if had_trailing_newline:
@@ -212,7 +220,7 @@ def build_fortran_edit_tools(project_root: Path) -> List[ToolSpec]:
         content_value = args.get("callable_content")
         if not file_path:
             return "Provide 'file_path' for the Fortran source file."
-        if callable_type not in {"subroutine", "function"}:
+        if callable_type not in _CALLABLE_KINDS:
             return "Provide 'callable_type' as 'subroutine' or 'function'."
         if not name:
             return "Provide 'name' for the new callable."
@@ -232,8 +240,8 @@ def build_fortran_edit_tools(project_root: Path) -> List[ToolSpec]:
         if new_text is None:
             return summary
 
-        write_result = write_whole_file(project_root, file_path, new_text)
-        if "Wrote" not in write_result:
+        ok, write_result = write_whole_file_checked(project_root, file_path, new_text)
+        if not ok:
             return write_result
         return f"{write_result}\n{summary}"
 
@@ -245,7 +253,7 @@ def build_fortran_edit_tools(project_root: Path) -> List[ToolSpec]:
         content_value = args.get("callable_content")
         if not file_path:
             return "Provide 'file_path' for the Fortran source file."
-        if callable_type not in {"subroutine", "function"}:
+        if callable_type not in _CALLABLE_KINDS:
             return "Provide 'callable_type' as 'subroutine' or 'function'."
         if not name:
             return "Provide 'name' for the callable to edit."
@@ -264,8 +272,8 @@ def build_fortran_edit_tools(project_root: Path) -> List[ToolSpec]:
         if new_text is None:
             return summary
 
-        write_result = write_whole_file(project_root, file_path, new_text)
-        if "Wrote" not in write_result:
+        ok, write_result = write_whole_file_checked(project_root, file_path, new_text)
+        if not ok:
             return write_result
         return f"{write_result}\n{summary}"
 
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import re
 from typing import Iterable, Iterator, List, Optional, Tuple
@@ -21,6 +22,7 @@ FORTRAN_SOURCE_SUFFIXES: Iterable[str] = (
     ".f03",
     ".f08",
 )
+_FORTRAN_SUFFIX_SET = frozenset(FORTRAN_SOURCE_SUFFIXES)
 
 FORTRAN_KEYWORDS = ("program", "module", "subroutine", "function")
 DECLARATION_PATTERN = re.compile(
@@ -31,10 +33,30 @@ END_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+def _sorted_dir_entries(directory: str) -> Iterator["os.DirEntry[str]"]:
+    try:
+        with os.scandir(directory) as entries:
+            return iter(sorted(entries, key=lambda entry: entry.name))
+    except OSError:
+        return iter(())
+
+
 def iter_fortran_sources(project_root: Path) -> Iterator[Path]:
-    for path in project_root.rglob("*"):
-        if path.is_file() and path.suffix.lower() in FORTRAN_SOURCE_SUFFIXES:
-            yield path
+    """
+    Yield Fortran sources depth-first, in name order within each directory.
+
+    Hidden directories such as .git or .venv are not descended into.
+    """
+    pending = [_sorted_dir_entries(str(project_root))]
+    while pending:
+        entry = next(pending[-1], None)
+        if entry is None:
+            pending.pop()
+        elif entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith("."):
+                pending.append(_sorted_dir_entries(entry.path))
+        elif os.path.splitext(entry.name)[1].lower() in _FORTRAN_SUFFIX_SET and entry.is_file():
+            yield Path(entry.path)
 
 
 def _remove_inline_comment(line: str) -> str:
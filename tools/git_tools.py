@@ -1,70 +1,189 @@
+import io
+import os
 import shlex
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from .file_tools import reset_backup_cache, write_generation, write_whole_file_checked
+from .path_utils import resolve_within_root, resolved_root
 from .tool_spec import ToolSpec
 
+_GIT = shutil.which("git") or "git"
+_GIT_ENV = {**os.environ, "LC_ALL": "C", "GIT_OPTIONAL_LOCKS": "0"}
+_PIPE_BUFSIZE = io.DEFAULT_BUFFER_SIZE * 16
+_PATHSPEC_STDIN_THRESHOLD = 50
+_READ_CACHE_TTL = 1.0
+_READ_OUTPUT_LIMIT = 256 * 1024
+_STATUS_ARGS = ["status", "--short", "--branch"]
+_read_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, Tuple[int, int, int], str]] = {}
+
+
+def _spawn_git(
+    repo_root: Path, args: List[str], stdin_bytes: Optional[bytes] = None
+) -> Tuple[int, str, str]:
+    """Run git and return (returncode, stdout, stderr), decoding each stream once."""
+    completed = subprocess.run(
+        [_GIT, *args],
+        cwd=str(repo_root),
+        input=stdin_bytes,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=_PIPE_BUFSIZE,
+        env=_GIT_ENV,
+        check=False,
+    )
+    return (
+        completed.returncode,
+        completed.stdout.decode("utf-8", "replace").strip(),
+        completed.stderr.decode("utf-8", "replace").strip(),
+    )
+
+
+def _spawn_git_bounded(repo_root: Path, args: List[str]) -> Tuple[int, str, str]:
+    """
+    Like _spawn_git, but keep at most _READ_OUTPUT_LIMIT bytes of stdout.
+
+    Once the cap is hit git is killed and the output is marked as truncated, so a
+    huge diff costs neither the full read nor the full decode.
+    """
+    proc = subprocess.Popen(
+        [_GIT, *args],
+        cwd=str(repo_root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=_GIT_ENV,
+    )
+    stderr_chunks: List[bytes] = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))
+    drain.start()
+
+    chunks: List[bytes] = []
+    captured = 0
+    truncated = False
+    fd = proc.stdout.fileno()
+    while True:
+        chunk = os.read(fd, _PIPE_BUFSIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        captured += len(chunk)
+        if captured >= _READ_OUTPUT_LIMIT:
+            truncated = True
+            proc.kill()
+            break
+    proc.stdout.close()
+    returncode = proc.wait()
+    drain.join()
+    proc.stderr.close()
+
+    stdout = b"".join(chunks)[:_READ_OUTPUT_LIMIT].decode("utf-8", "replace").strip()
+    if truncated:
+        # The kill is ours, not a git failure.
+        return 0, stdout + "\n... (truncated)", ""
+    return returncode, stdout, b"".join(stderr_chunks).decode("utf-8", "replace").strip()
+
 
 def _run_git(repo_root: Path, args: List[str]) -> str:
     try:
-        completed = subprocess.run(
-            ["git"] + args,
-            cwd=str(repo_root),
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if completed.returncode != 0:
-            return completed.stderr.strip() or f"git {' '.join(args)} failed."
-        return completed.stdout.strip() or "(no output)"
+        returncode, stdout, stderr = _spawn_git_bounded(repo_root, args)
+        if returncode != 0:
+            return stderr or f"git {' '.join(args)} failed."
+        return stdout or "(no output)"
     except FileNotFoundError:
         return "git executable not available on this system."
     except Exception as exc:
         return f"Error running git {' '.join(args)}: {exc}"
 
 
-def _run_git_checked(repo_root: Path, args: List[str]) -> Tuple[bool, str]:
+def _run_git_checked(
+    repo_root: Path, args: List[str], stdin_bytes: Optional[bytes] = None
+) -> Tuple[bool, str]:
     try:
-        completed = subprocess.run(
-            ["git"] + args,
-            cwd=str(repo_root),
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        returncode, stdout, stderr = _spawn_git(repo_root, args, stdin_bytes)
     except FileNotFoundError:
         return False, "git executable not available on this system."
     except Exception as exc:
         return False, f"Error running git {' '.join(args)}: {exc}"
 
-    stdout = completed.stdout.strip()
-    stderr = completed.stderr.strip()
     output = stdout or stderr or "(no output)"
-    if completed.returncode != 0:
+    if returncode != 0:
         if not stderr:
             output = f"git {' '.join(args)} failed."
         return False, output
     return True, output
 
 
+def _read_cache_state(repo_root: Path) -> Optional[Tuple[int, int, int]]:
+    git_dir = repo_root / ".git"
+    try:
+        return (
+            os.stat(git_dir / "index").st_mtime_ns,
+            os.stat(git_dir / "HEAD").st_mtime_ns,
+            write_generation(),
+        )
+    except OSError:
+        return None
+
+
+def _cached_git_output(repo_root: Path, args: List[str]) -> Optional[str]:
+    """Return cached output for a read-only git command if it is still valid."""
+    state = _read_cache_state(repo_root)
+    cached = _read_cache.get((str(repo_root), tuple(args)))
+    if state is None or not cached:
+        return None
+    if cached[1] != state or time.monotonic() - cached[0] >= _READ_CACHE_TTL:
+        return None
+    return cached[2]
+
+
+def _run_git_cached(repo_root: Path, args: List[str]) -> str:
+    """
+    Run a read-only git command, reusing output from the last second.
+
+    Cached output is only served while .git/index, .git/HEAD and the tool write
+    counter are unchanged; commits made through these tools clear the cache.
+    """
+    cached = _cached_git_output(repo_root, args)
+    if cached is not None:
+        return cached
+    state = _read_cache_state(repo_root)
+    output = _run_git(repo_root, args)
+    if state is not None:
+        _read_cache[(str(repo_root), tuple(args))] = (time.monotonic(), state, output)
+    return output
+
+
 def git_status(repo_root: Path) -> str:
-    return _run_git(repo_root, ["status", "--short", "--branch"])
+    return _run_git_cached(repo_root, _STATUS_ARGS)
 
 
 def git_diff(repo_root: Path, diff_target: str = "--stat") -> str:
+    target = diff_target.strip()
+    if target in ("", "--stat"):
+        # A fresh status with only the branch line means there is nothing to diff.
+        status = _cached_git_output(repo_root, _STATUS_ARGS)
+        if status is not None and status.startswith("## ") and "\n" not in status:
+            return "(no output)"
     args = ["diff"]
-    if diff_target.strip():
-        args.append(diff_target.strip())
-    return _run_git(repo_root, args)
+    if target:
+        args.append(target)
+    return _run_git_cached(repo_root, args)
 
 
 def _format_git_command(args: List[str]) -> str:
-    try:
-        formatter = shlex.join  # type: ignore[attr-defined]
-    except AttributeError:
-        formatter = lambda tokens: " ".join(tokens)
-    return f"git {formatter(args)}"
+    return "git " + shlex.join(args)
+
+
+def _log_git_command(args: List[str], output: str, stdin_paths: int = 0) -> str:
+    header = _format_git_command(args)
+    if stdin_paths:
+        header += f"  # {stdin_paths} path(s) on stdin"
+    return f"$ {header}\n{output}"
 
 
 def _commit_files(repo_root: Path, commit_message: str, files: List[str]) -> str:
@@ -72,34 +191,85 @@ def _commit_files(repo_root: Path, commit_message: str, files: List[str]) -> str
     if not message:
         return "Provide 'commit_message' describing the changes."
 
-    if files:
-        add_args = ["add"] + files
+    add_stdin: Optional[bytes] = None
+    if len(files) > _PATHSPEC_STDIN_THRESHOLD:
+        # Long file lists go through stdin to stay clear of ARG_MAX.
+        add_args = ["add", "--pathspec-from-file=-", "--pathspec-file-nul"]
+        add_stdin = b"\0".join(os.fsencode(path) for path in files)
+    elif files:
+        add_args = ["add", "--"] + files
     else:
         add_args = ["add", "-A"]
+    stdin_paths = len(files) if add_stdin is not None else 0
 
     run_log = []
-    success, output = _run_git_checked(repo_root, add_args)
-    run_log.append(f"$ {_format_git_command(add_args)}\n{output}")
+    success, output = _run_git_checked(repo_root, add_args, add_stdin)
+    _read_cache.clear()
+    run_log.append(_log_git_command(add_args, output, stdin_paths))
     if not success:
         return "GitCommitFiles aborted while staging changes:\n\n" + "\n\n".join(run_log)
 
     commit_args = ["commit", "-m", message]
     success, output = _run_git_checked(repo_root, commit_args)
-    run_log.append(f"$ {_format_git_command(commit_args)}\n{output}")
+    _read_cache.clear()
+    run_log.append(_log_git_command(commit_args, output))
     if not success:
         return "GitCommitFiles aborted while committing changes:\n\n" + "\n\n".join(run_log)
 
+    reset_backup_cache()
     return "Changes committed successfully.\n\n" + "\n\n".join(run_log)
 
 
+def _write_files_and_commit(
+    project_root: Path,
+    repo_root: Path,
+    entries: List[Tuple[str, str]],
+    commit_message: str,
+) -> str:
+    if not commit_message.strip():
+        return "Provide 'commit_message' describing the changes."
+    if not entries:
+        return "Provide 'files' as a non-empty array of {file_path, content} objects."
+
+    repo_resolved = resolved_root(repo_root)
+    staged: List[str] = []
+    for file_path, _ in entries:
+        try:
+            target = resolve_within_root(project_root, file_path)
+            staged.append(str(target.relative_to(repo_resolved)))
+        except ValueError as exc:
+            return f"Cannot commit '{file_path}': {exc}"
+    if len(set(staged)) != len(staged):
+        return "Each file may only appear once in 'files'."
+
+    # Targets are distinct, so the backup+write of each file can overlap.
+    workers = min(32, len(entries), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(
+            pool.map(lambda entry: write_whole_file_checked(project_root, *entry), entries)
+        )
+    write_log = [message for _, message in results]
+    if not all(ok for ok, _ in results):
+        written = [path for path, (ok, _) in zip(staged, results) if ok]
+        summary = "GitWriteFilesAndCommit aborted while writing files; nothing was committed."
+        if written:
+            summary += (
+                "\nThese files were written and are left uncommitted (existing files keep"
+                " a '.orig' backup): " + ", ".join(written)
+            )
+        return summary + "\n\n" + "\n\n".join(write_log)
+
+    return "\n".join(write_log) + "\n\n" + _commit_files(repo_root, commit_message, staged)
+
+
 def build_git_tools(project_root: Path, repo_root: Path, base_branch: str) -> List[ToolSpec]:
-    _ = project_root  # retained for compatibility; editing tools now live elsewhere.
     _ = base_branch  # retained for compatibility; not needed without patch workflow.
     status_tool = ToolSpec(
         name="GitStatus",
         description="Show the current git status and branch information.",
         parameters={"type": "object", "properties": {}},
         func=lambda _: git_status(repo_root),
+        read_only=True,
     )
 
     def _diff_tool(args: Dict[str, str]) -> str:
@@ -119,6 +289,7 @@ def build_git_tools(project_root: Path, repo_root: Path, base_branch: str) -> Li
             },
         },
         func=_diff_tool,
+        read_only=True,
     )
 
     def _commit_tool(args: Dict[str, str]) -> str:
@@ -156,8 +327,62 @@ def build_git_tools(project_root: Path, repo_root: Path, base_branch: str) -> Li
         func=_commit_tool,
     )
 
+    def _write_and_commit_tool(args: Dict) -> str:
+        commit_message = args.get("commit_message") or ""
+        files_arg = args.get("files")
+        if not isinstance(files_arg, list):
+            return "'files' must be an array of {file_path, content} objects."
+        entries: List[Tuple[str, str]] = []
+        for item in files_arg:
+            if not isinstance(item, dict):
+                return "'files' must be an array of {file_path, content} objects."
+            file_path = str(item.get("file_path") or "").strip()
+            content = item.get("content")
+            if not file_path or content is None:
+                return "Each 'files' entry needs 'file_path' and 'content'."
+            entries.append((file_path, str(content)))
+        return _write_files_and_commit(project_root, repo_root, entries, commit_message)
+
+    write_and_commit_tool = ToolSpec(
+        name="GitWriteFilesAndCommit",
+        description=(
+            "Write several files (each backed up to '<file>.orig' first) and commit them "
+            "together with one 'git add' and one 'git commit'."
+        ),
+        parameters={
+            "type": "object",
+            "properties": {
+                "files": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_path": {
+                                "type": "string",
+                                "description": "Relative path to the project file to write.",
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "Complete new contents of the file.",
+                            },
+                        },
+                        "required": ["file_path", "content"],
+                    },
+                    "description": "Files to write before committing.",
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message describing the changes.",
+                },
+            },
+            "required": ["files", "commit_message"],
+        },
+        func=_write_and_commit_tool,
+    )
+
     return [
         status_tool,
         diff_tool,
         commit_tool,
+        write_and_commit_tool,
     ]
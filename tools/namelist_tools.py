@@ -1,3 +1,5 @@
+import functools
+import os
 from pathlib import Path
 from typing import Dict
 
@@ -6,11 +8,19 @@ import f90nml
 from .tool_spec import ToolSpec
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_namelist(path: str, mtime_ns: int, size: int) -> f90nml.Namelist:
+    """Parse a namelist once per (path, mtime, size); edits to the deck miss the cache."""
+    return f90nml.read(path)
+
+
 def read_namelist_var(file_path: Path, group: str, variable: str) -> str:
     try:
-        if not file_path.exists():
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return f"Namelist file not found: {file_path}"
-        nml = f90nml.read(file_path)
+        nml = _parse_namelist(str(file_path), st.st_mtime_ns, st.st_size)
         value = nml[group][variable]
         return f"{variable} in group {group} is set to: {value}"
     except Exception as exc:
@@ -46,4 +56,5 @@ def build_namelist_tool(namelist_path: Path) -> ToolSpec:
             "required": ["group", "variable"],
         },
         func=_tool,
+        read_only=True,
     )
@@ -1,6 +1,16 @@
+import functools
+import os
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=8)
+def resolved_root(root: Path) -> Path:
+    """
+    Return root.resolve(), memoised because tool roots are fixed for a session.
+    """
+    return root.resolve()
+
+
 def resolve_within_root(root: Path, requested_path: str) -> Path:
     """
     Resolve a user-provided path and ensure it stays inside the given root.
@@ -10,12 +20,10 @@ def resolve_within_root(root: Path, requested_path: str) -> Path:
     candidate = Path(requested_path.strip()).expanduser()
     if not candidate.is_absolute():
         candidate = root / candidate
-    root_resolved = root.resolve()
-    candidate = candidate.resolve()
-    try:
-        candidate.relative_to(root_resolved)
-    except ValueError as exc:
+    root_str = str(resolved_root(root))
+    candidate_str = os.path.realpath(candidate)
+    if os.path.commonpath([root_str, candidate_str]) != root_str:
         raise ValueError(
-            f"Requested path {candidate} is outside the allowed root {root_resolved}"
-        ) from exc
-    return candidate
+            f"Requested path {candidate_str} is outside the allowed root {root_str}"
+        )
+    return Path(candidate_str)
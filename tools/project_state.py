@@ -1,43 +1,76 @@
+import heapq
+import os
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+from .file_tools import write_generation
 from .fortran_utils import iter_fortran_sources
 from .tool_spec import ToolSpec
 
+_SOURCES_CACHE_TTL = 5.0
+
 
 def describe_project(project_root: Path, max_entries: int = 200) -> str:
     """Return a lightweight tree of the project for grounding."""
+    with os.scandir(project_root) as scanned:
+        children = sorted(scanned, key=lambda entry: entry.name)
     entries = []
-    for path in sorted(project_root.iterdir()):
-        marker = "[DIR]" if path.is_dir() else "[FILE]"
-        entries.append(f"{marker} {path.relative_to(project_root)}")
+    for entry in children:
+        marker = "[DIR]" if entry.is_dir() else "[FILE]"
+        entries.append(f"{marker} {entry.name}")
         if len(entries) >= max_entries:
             break
     return "\n".join(entries) or "Project directory is empty."
 
 
 def list_fortran_sources(project_root: Path, max_files: int = 30) -> str:
-    sorted_paths = sorted(
-        (path for path in iter_fortran_sources(project_root)),
-        key=lambda path: str(path.relative_to(project_root)),
+    relative_paths = (
+        str(path.relative_to(project_root)) for path in iter_fortran_sources(project_root)
     )
-    files = [str(path.relative_to(project_root)) for path in sorted_paths[:max_files]]
+    files = heapq.nsmallest(max_files, relative_paths)
     if not files:
         return f"No Fortran sources found under {project_root}"
     return "Fortran sources:\n" + "\n".join(files)
 
 
 def build_project_overview_tools(project_root: Path) -> List[ToolSpec]:
+    # The top-level listing only changes when the root directory's mtime does.
+    tree_cache: Dict[str, object] = {"mtime_ns": None, "value": ""}
+
+    def _project_tree(_: Dict) -> str:
+        try:
+            mtime_ns = os.stat(project_root).st_mtime_ns
+        except OSError:
+            return describe_project(project_root)
+        if tree_cache["mtime_ns"] != mtime_ns:
+            tree_cache["value"] = describe_project(project_root)
+            tree_cache["mtime_ns"] = mtime_ns
+        return str(tree_cache["value"])
+
     overview_tool = ToolSpec(
         name="ProjectTree",
         description="Show the top-level layout of the Fortran project directory.",
         parameters={"type": "object", "properties": {}},
-        func=lambda _: describe_project(project_root),
+        func=_project_tree,
+        read_only=True,
     )
 
+    # Nested edits do not touch the root mtime, so the recursive listing is reused
+    # for a few seconds instead, and dropped as soon as a tool writes a file.
+    sources_cache: Dict[Tuple[int, int], Tuple[float, str]] = {}
+
     def _list_sources(args: Dict[str, int]) -> str:
         max_files = int(args.get("max_files", 30) or 30)
-        return list_fortran_sources(project_root, max_files=max_files)
+        key = (max_files, write_generation())
+        cached = sources_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _SOURCES_CACHE_TTL:
+            return cached[1]
+        listing = list_fortran_sources(project_root, max_files=max_files)
+        sources_cache.clear()
+        sources_cache[key] = (now, listing)
+        return listing
 
     list_sources_tool = ToolSpec(
         name="ListFortranSources",
@@ -53,5 +86,6 @@ def build_project_overview_tools(project_root: Path) -> List[ToolSpec]:
             },
         },
         func=_list_sources,
+        read_only=True,
     )
     return [overview_tool, list_sources_tool]
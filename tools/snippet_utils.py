@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Iterable, List, Optional, Sequence
 
 
@@ -5,20 +6,15 @@ def format_numbered_snippet(lines: Sequence[str], start_line: int, width: int =
     """
     Return a string where each line is prefixed with a line number.
     """
-    template = f"{{:0{width}d}}: {{}}"
+    numbers = range(start_line, start_line + len(lines))
     return "\n".join(
-        template.format(start_line + idx, line) for idx, line in enumerate(lines)
+        [f"{str(number).zfill(width)}: {line}" for number, line in zip(numbers, lines)]
     )
 
 
 def iter_numbered_lines(
     iterable: Iterable[str], start_line: int = 1, max_lines: Optional[int] = None
 ) -> List[str]:
-    collected: List[str] = []
-    for idx, line in enumerate(iterable, start=1):
-        if idx < start_line:
-            continue
-        if max_lines is not None and len(collected) >= max_lines:
-            break
-        collected.append(line.rstrip("\n"))
-    return collected
+    skip = max(start_line, 1) - 1
+    stop = None if max_lines is None else skip + max(max_lines, 0)
+    return [line.rstrip("\n") for line in islice(iterable, skip, stop)]
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import Any, Callable, Dict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
     """Represents a callable tool that can be advertised to Ollama."""
 
@@ -10,14 +10,38 @@ class ToolSpec:
     description: str
     parameters: Dict[str, Any]
     func: Callable[[Dict[str, Any]], str]
+    read_only: bool = False  # safe to run concurrently with other read-only tools
+    _ollama_tool: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Specs are immutable, so the advertised schema can be built once.
+        object.__setattr__(
+            self,
+            "_ollama_tool",
+            {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            },
+        )
 
     def as_ollama_tool(self) -> Dict[str, Any]:
         """Return the JSON schema Ollama expects (function tools)."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        return self._ollama_tool
+
+
+_payload_cache: Dict[Tuple[int, ...], Tuple[Tuple[ToolSpec, ...], List[Dict[str, Any]]]] = {}
+
+
+def tools_payload(tools: Sequence[ToolSpec]) -> List[Dict[str, Any]]:
+    """Return the 'tools' list for ollama.chat, built once per toolset."""
+    key = tuple(id(tool) for tool in tools)
+    cached = _payload_cache.get(key)
+    if cached is None:
+        # Keep the specs alive alongside the payload so their ids cannot be reused.
+        cached = (tuple(tools), [tool.as_ollama_tool() for tool in tools])
+        _payload_cache[key] = cached
+    return cached[1]